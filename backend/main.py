@@ -1,15 +1,25 @@
 # main.py — your entire FastAPI app starts here
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 from typing import Optional
 from services.llm import get_llm
 from langchain_core.prompts import ChatPromptTemplate
 
+# Use orjson for responses when installed; fall back to stdlib json otherwise
+try:
+    import orjson  # noqa: F401
+    DefaultResponse = ORJSONResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
 app = FastAPI(
     title="ImmigrationIQ API",
     description="AI-powered immigration guidance",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=DefaultResponse,
 )
 
 # CORS — allow your Next.js frontend to call this API
@@ -20,6 +30,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Gzip — LLM answers are plain English and compress well; skip tiny bodies
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # ---- Models (Pydantic) ----
 class ChatRequest(BaseModel):
     message: str
@@ -46,5 +59,11 @@ async def chat(request: ChatRequest):
         session_id=request.session_id
     )
 
+# Install (all backend runtime deps — requirements.txt is not tracked):
+#   pip install fastapi "uvicorn[standard]" orjson langchain-core langchain-groq langchain-ollama
+#   ("uvicorn[standard]" brings uvloop + httptools; orjson speeds up JSON responses)
 # Run with: uvicorn main:app --reload
+# Production:
+#   uvicorn main:app --host 0.0.0.0 --workers $(nproc) --loop uvloop --http httptools
+# Each worker is a separate process, so don't keep per-user state in module globals.
 # Docs at: http://localhost:8000/docs
\ No newline at end of file
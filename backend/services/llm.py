@@ -1,5 +1,6 @@
 import os
-from langchain_community import Ollama
+from functools import lru_cache
+from langchain_ollama import ChatOllama
 from langchain_groq import ChatGroq
 from langchain_core.language_models import BaseLanguageModel
 
@@ -8,19 +9,23 @@ def get_llm ( temperature: float = 0.1) -> BaseLanguageModel:
     LLM factory — uses Ollama locally, Groq in production.
     This is THE most important function in your codebase.
     Every AI feature goes through here.
+    One client is built per temperature value and reused, however it's called.
     """
+    return _build_llm(float(temperature))
 
+@lru_cache(maxsize=None)
+def _build_llm(temperature: float) -> BaseLanguageModel:
+    # Always called positionally with a float, so the cache key is just the value
     if os.getenv("GROQ_API_KEY"):
         # In production, use Groq free tier
-        from langchain_groq import ChatGroq
         return ChatGroq(
             model_name="llama-3.1-8b-instant",
             temperature=temperature,
             max_tokens=2048
         )
     else:
-        # Local: Ollama
-        return Ollama(
+        # Local: Ollama (chat model, so ainvoke/astream are truly async)
+        return ChatOllama(
             model="llama3.2",
             temperature=temperature,
-        )
\ No newline at end of file
+        )